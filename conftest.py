@@ -0,0 +1,12 @@
+"""
+pytest configuration for Supermarket Sales Data Warehouse
+
+Puts the project root on sys.path once so tests import the src package directly.
+"""
+
+import sys
+from pathlib import Path
+
+project_root = str(Path(__file__).parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
@@ -9,6 +9,7 @@ This version can be run independently without the project structure
 import os
 import sys
 import psycopg2
+import sqlparse
 from pathlib import Path
 
 # Fix encoding for Windows console to support Unicode characters (emojis)
@@ -22,6 +23,9 @@ if sys.platform == 'win32':
         sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
         sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
 
+# Print progress every N statements instead of once per statement
+PROGRESS_EVERY = 50
+
 def get_database_config():
     """
     Get database configuration
@@ -35,83 +39,15 @@ def get_database_config():
         'password': ''
     }
 
-def read_sql_file(file_path: str) -> str:
-    """
-    Read SQL file content
-    """
-    try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            content = file.read()
-        print(f"✅ Successfully read SQL file: {file_path}")
-        return content
-    except Exception as e:
-        print(f"❌ Failed to read SQL file {file_path}: {str(e)}")
-        raise
-
 def split_sql_statements(sql_content: str) -> list:
     """
-    Smart SQL statement splitter that handles dollar-quoted strings, comments, and multi-line statements
+    Split SQL script into statements using sqlparse
+    (handles $tag$ dollar quotes, doubled quotes and block comments)
     """
-    statements = []
-    current_statement = []
-    in_dollar_quote = False
-    dollar_tag = None
-    in_single_quote = False
-    in_comment = False
-    
-    lines = sql_content.split('\n')
-    
-    for line in lines:
-        stripped = line.strip()
-        
-        # Skip empty lines and SQL comments at the start
-        if not stripped or stripped.startswith('--'):
-            continue
-        
-        # Check for dollar-quoted strings (used in stored procedures)
-        i = 0
-        while i < len(line):
-            # Handle dollar quotes
-            if not in_single_quote and not in_comment:
-                if line[i:i+2] == '$$':
-                    if not in_dollar_quote:
-                        in_dollar_quote = True
-                        dollar_tag = '$$'
-                        i += 2
-                        continue
-                    elif dollar_tag == '$$':
-                        in_dollar_quote = False
-                        dollar_tag = None
-                        i += 2
-                        continue
-            
-            # Handle single quotes
-            if not in_dollar_quote and not in_comment:
-                if line[i] == "'":
-                    if i > 0 and line[i-1] == '\\':
-                        pass  # Escaped quote
-                    else:
-                        in_single_quote = not in_single_quote
-            
-            i += 1
-        
-        # Add line to current statement
-        current_statement.append(line)
-        
-        # Check if statement is complete (ends with semicolon outside quotes)
-        if not in_dollar_quote and not in_single_quote and stripped.endswith(';'):
-            stmt = '\n'.join(current_statement).strip()
-            if stmt and stmt != ';':
-                statements.append(stmt)
-            current_statement = []
-    
-    # Add any remaining statement
-    if current_statement:
-        stmt = '\n'.join(current_statement).strip()
-        if stmt and stmt != ';':
-            statements.append(stmt)
-    
-    return statements
+    return [
+        statement for statement in sqlparse.split(sql_content)
+        if sqlparse.format(statement, strip_comments=True).strip()
+    ]
 
 def execute_sql_script(sql_content: str, db_config: dict) -> bool:
     """
@@ -145,7 +81,8 @@ def execute_sql_script(sql_content: str, db_config: dict) -> bool:
                 try:
                     cursor.execute(statement)
                     successful += 1
-                    print(f"✅ Statement {i}/{len(statements)} executed successfully")
+                    if i % PROGRESS_EVERY == 0:
+                        print(f"📋 {i}/{len(statements)} statements executed...")
                 except Exception as e:
                     failed += 1
                     # Show first 100 chars of failed statement for debugging
@@ -166,39 +103,12 @@ def execute_sql_script(sql_content: str, db_config: dict) -> bool:
         if conn:
             conn.close()
 
-def check_database_exists(db_config: dict) -> bool:
-    """
-    Check if the database exists
-    """
-    try:
-        # Connect to default postgres database to check if our database exists
-        conn = psycopg2.connect(
-            host=db_config['host'],
-            port=db_config['port'],
-            database='postgres',  # Connect to default postgres database
-            user=db_config['user'],
-            password=db_config['password']
-        )
-        
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT 1 FROM pg_database WHERE datname = %s",
-            (db_config['name'],)
-        )
-        
-        exists = cursor.fetchone() is not None
-        conn.close()
-        
-        return exists
-        
-    except Exception as e:
-        print(f"❌ Failed to check database existence: {str(e)}")
-        return False
-
 def create_database_if_not_exists(db_config: dict) -> bool:
     """
     Create database if it doesn't exist
+    (a single CREATE DATABASE attempt; an existing database is not an error)
     """
+    conn = None
     try:
         # Connect to default postgres database
         conn = psycopg2.connect(
@@ -215,16 +125,17 @@ def create_database_if_not_exists(db_config: dict) -> bool:
         # Create database if it doesn't exist
         cursor.execute(f"CREATE DATABASE {db_config['name']}")
         print(f"✅ Database '{db_config['name']}' created successfully")
-        
-        conn.close()
         return True
         
     except psycopg2.errors.DuplicateDatabase:
-        print(f"📋 Database '{db_config['name']}' already exists")
+        print(f"✅ Database '{db_config['name']}' already exists")
         return True
     except Exception as e:
         print(f"❌ Failed to create database: {str(e)}")
         return False
+    finally:
+        if conn:
+            conn.close()
 
 def main():
     """
@@ -238,14 +149,10 @@ def main():
         db_config = get_database_config()
         print(f"📋 Using database: {db_config['name']} on {db_config['host']}:{db_config['port']}")
         
-        # Check if database exists, create if not
-        if not check_database_exists(db_config):
-            print("📋 Database doesn't exist, creating...")
-            if not create_database_if_not_exists(db_config):
-                print("❌ Failed to create database")
-                return False
-        else:
-            print("✅ Database already exists")
+        # Create database if it doesn't exist
+        if not create_database_if_not_exists(db_config):
+            print("❌ Failed to create database")
+            return False
         
         # Read SQL file
         current_dir = Path(__file__).parent
@@ -254,7 +161,7 @@ def main():
             print(f"❌ SQL file not found: {sql_file_path}")
             return False
         
-        sql_content = read_sql_file(str(sql_file_path))
+        sql_content = sql_file_path.read_text(encoding='utf-8')
         
         # Execute SQL script
         if execute_sql_script(sql_content, db_config):
@@ -93,6 +93,32 @@ CREATE TABLE IF NOT EXISTS fact_sales (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- =============================================
+-- STAGING TABLE
+-- =============================================
+
+-- Staging: raw CSV rows loaded with COPY (column order matches SuperMarketAnalysis.csv)
+CREATE TABLE IF NOT EXISTS stg_supermarket_sales (
+    row_id BIGSERIAL PRIMARY KEY,
+    invoice_id VARCHAR(50),
+    branch VARCHAR(50),
+    city VARCHAR(50),
+    customer_type VARCHAR(50),
+    gender VARCHAR(50),
+    product_line VARCHAR(100),
+    unit_price NUMERIC,
+    quantity INTEGER,
+    tax_5_percent NUMERIC,
+    sales NUMERIC,
+    date VARCHAR(20),
+    time VARCHAR(20),
+    payment VARCHAR(50),
+    cogs NUMERIC,
+    gross_margin_percentage NUMERIC,
+    gross_income NUMERIC,
+    rating NUMERIC
+);
+
 -- =============================================
 -- INDEXES FOR PERFORMANCE
 -- =============================================
@@ -147,6 +173,35 @@ JOIN dim_time dt ON fs.time_id = dt.time_id
 JOIN dim_branch db ON fs.branch_id = db.branch_id
 JOIN dim_payment dpm ON fs.payment_id = dpm.payment_id;
 
+-- View: cleaned staging rows (same cleaning rules as DataTransformer._clean_data)
+CREATE OR REPLACE VIEW v_stg_supermarket_sales AS
+SELECT 
+    row_id,
+    invoice_id,
+    TRIM(branch) AS branch,
+    TRIM(city) AS city,
+    TRIM(customer_type) AS customer_type,
+    TRIM(gender) AS gender,
+    TRIM(product_line) AS product_line,
+    unit_price::DECIMAL(10,2) AS unit_price,
+    quantity,
+    tax_5_percent,
+    sales,
+    TO_DATE(date, 'MM/DD/YYYY') AS date,
+    time::TIME AS time,
+    TRIM(payment) AS payment_method,
+    cogs,
+    gross_margin_percentage,
+    gross_income,
+    rating
+FROM stg_supermarket_sales
+WHERE invoice_id IS NOT NULL AND branch IS NOT NULL AND city IS NOT NULL
+  AND customer_type IS NOT NULL AND gender IS NOT NULL AND product_line IS NOT NULL
+  AND unit_price IS NOT NULL AND quantity IS NOT NULL AND tax_5_percent IS NOT NULL
+  AND sales IS NOT NULL AND date IS NOT NULL AND time IS NOT NULL AND payment IS NOT NULL
+  AND cogs IS NOT NULL AND gross_margin_percentage IS NOT NULL
+  AND gross_income IS NOT NULL AND rating IS NOT NULL;
+
 -- =============================================
 -- GRANTS (Optional)
 -- =============================================
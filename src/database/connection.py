@@ -3,33 +3,108 @@
 Database connection utilities for Supermarket Sales Data Warehouse
 """
 
+import io
+import struct
+import functools
 import psycopg2
+import psycopg2.extras
+import numpy as np
 import pandas as pd
-from sqlalchemy import create_engine
-from typing import Optional, Dict, Any
+from sqlalchemy import create_engine, text
+from sqlalchemy.sql.elements import TextClause
+from typing import Optional, Dict, Any, Iterable, List
 from contextlib import contextmanager
 
-from ..utils.config import get_database_config
+from ..utils.config import get_database_config, get_etl_config
 from ..utils.logging import get_logger
+from ..utils.files import FILE_BUFFER_SIZE
 
 logger = get_logger(__name__)
 
+# Binary COPY wire format
+PGCOPY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0)
+PGCOPY_TRAILER = struct.pack('>h', -1)
+
+# Fixed-width PostgreSQL types that can be binary-encoded straight from numpy
+BINARY_COPY_TYPES = {
+    'smallint': '>i2',
+    'integer': '>i4',
+    'bigint': '>i8',
+    'real': '>f4',
+    'double precision': '>f8',
+    'boolean': '?',
+    'date': '>i4',                      # days since 2000-01-01
+    'time without time zone': '>i8',    # microseconds since midnight
+}
+
+# PostgreSQL binary dates count from 2000-01-01 (10957 days after the Unix epoch)
+PG_EPOCH_DAYS = 10957
+
+# Rows rendered to CSV at a time when streaming a DataFrame into COPY
+COPY_CHUNK_ROWS = 10_000
+# Bytes per read/write between psycopg2 and the COPY file object (psycopg2 default is 8 KiB)
+COPY_BUFFER_SIZE = 1 << 16
+
+class _DataFrameCSVStream:
+    """Read-only file-like object that renders a DataFrame to CSV on demand"""
+    
+    def __init__(self, df: pd.DataFrame, chunk_rows: int = COPY_CHUNK_ROWS):
+        self._chunks = (
+            df.iloc[start:start + chunk_rows].to_csv(index=False, header=False, na_rep='\\N')
+            for start in range(0, len(df), chunk_rows)
+        )
+        self._current = io.StringIO()
+    
+    def read(self, size: int = -1) -> str:
+        """Return up to size characters, rendering further row chunks as needed"""
+        parts = []
+        remaining = size
+        while size < 0 or remaining > 0:
+            data = self._current.read(remaining if size >= 0 else -1)
+            if data:
+                parts.append(data)
+                remaining -= len(data)
+                continue
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._current = io.StringIO(chunk)
+        return ''.join(parts)
+
 class DatabaseConnection:
     """Database connection manager"""
     
     def __init__(self):
         self.config = get_database_config()
         self.engine = None
+        # Parsed statements keyed by SQL string, reused across calls
+        self._stmt_cache: Dict[str, TextClause] = {}
+        # Target column types per table, used by binary COPY
+        self._column_types: Dict[str, Dict[str, str]] = {}
         self._create_engine()
     
     def _create_engine(self):
         """Create SQLAlchemy engine"""
         try:
             connection_string = (
-                f"postgresql://{self.config['user']}:{self.config['password']}"
+                f"postgresql+psycopg2://{self.config['user']}:{self.config['password']}"
                 f"@{self.config['host']}:{self.config['port']}/{self.config['name']}"
             )
-            self.engine = create_engine(connection_string)
+            # One QueuePool shared by the loader's COPY workers and the
+            # parallel exports; sized from database.pool in config
+            pool = self.config.get('pool', {})
+            self.engine = create_engine(
+                connection_string,
+                pool_size=pool.get('size', 8),
+                max_overflow=pool.get('max_overflow', 16),
+                pool_timeout=pool.get('timeout', 30),
+                pool_pre_ping=pool.get('pre_ping', True),
+                pool_recycle=pool.get('recycle', 1800),
+                # psycopg2 fast path for executemany-style INSERTs (e.g. to_sql)
+                executemany_mode='values_plus_batch',
+                insertmanyvalues_page_size=10000,
+                executemany_batch_page_size=1000
+            )
             logger.info("Database engine created successfully")
         except Exception as e:
             logger.error(f"Failed to create database engine: {str(e)}")
@@ -49,6 +124,24 @@ class DatabaseConnection:
             if conn:
                 conn.close()
     
+    def _statement(self, sql: str) -> TextClause:
+        """
+        Get cached TextClause for SQL string
+        
+        SQLAlchemy keys its compiled-statement cache on the statement object,
+        so reusing one TextClause per query skips re-parsing bind parameters.
+        
+        Args:
+            sql: SQL string
+            
+        Returns:
+            TextClause for the SQL string
+        """
+        stmt = self._stmt_cache.get(sql)
+        if stmt is None:
+            stmt = self._stmt_cache[sql] = text(sql)
+        return stmt
+    
     def execute_query(self, query: str, params: Optional[Dict] = None) -> pd.DataFrame:
         """
         Execute SQL query and return DataFrame
@@ -62,7 +155,7 @@ class DatabaseConnection:
         """
         try:
             with self.get_connection() as conn:
-                df = pd.read_sql(query, conn, params=params)
+                df = pd.read_sql(self._statement(query), conn, params=params)
                 logger.info(f"Query executed successfully, returned {len(df)} rows")
                 return df
         except Exception as e:
@@ -79,14 +172,30 @@ class DatabaseConnection:
         """
         try:
             with self.get_connection() as conn:
-                from sqlalchemy import text
-                conn.execute(text(command), params)
+                conn.execute(self._statement(command), params)
                 conn.commit()
                 logger.info("Command executed successfully")
         except Exception as e:
             logger.error(f"Command execution failed: {str(e)}")
             raise
     
+    def execute_many(self, command: str, seq_of_params: Iterable, page_size: int = 1000) -> None:
+        """
+        Execute SQL command for many parameter sets in batched roundtrips
+        
+        Args:
+            command: SQL command string in psycopg2 paramstyle (%s or %(name)s)
+            seq_of_params: Sequence of parameter tuples or dicts
+            page_size: Number of parameter sets sent per roundtrip
+        """
+        try:
+            with self._raw_transaction() as raw, raw.cursor() as cur:
+                psycopg2.extras.execute_batch(cur, command, seq_of_params, page_size=page_size)
+            logger.info("Batched command executed successfully")
+        except Exception as e:
+            logger.error(f"Batched command execution failed: {str(e)}")
+            raise
+    
     def insert_dataframe(self, df: pd.DataFrame, table_name: str, if_exists: str = 'append') -> None:
         """
         Insert DataFrame into database table
@@ -96,6 +205,11 @@ class DatabaseConnection:
             table_name: Target table name
             if_exists: What to do if table exists ('append', 'replace', 'fail')
         """
+        # Appending goes through COPY; 'replace'/'fail' need pandas to manage the DDL
+        if if_exists == 'append':
+            self.copy_dataframe(df, table_name)
+            return
+        
         try:
             with self.get_connection() as conn:
                 df.to_sql(table_name, conn, if_exists=if_exists, index=False, method='multi')
@@ -103,18 +217,257 @@ class DatabaseConnection:
         except Exception as e:
             logger.error(f"Failed to insert DataFrame: {str(e)}")
             raise
+    
+    @contextmanager
+    def _raw_transaction(self, conn=None):
+        """
+        Raw psycopg2 connection for one unit of work
+        
+        Args:
+            conn: Raw connection whose transaction the caller owns; yielded
+                as is. If None, a pooled connection is checked out, committed
+                on success, rolled back on error and returned to the pool
+        """
+        if conn is not None:
+            yield conn
+            return
+        
+        raw = self.engine.raw_connection()
+        try:
+            yield raw
+            raw.commit()
+        except Exception:
+            raw.rollback()
+            raise
+        finally:
+            raw.close()
+    
+    @contextmanager
+    def bulk_load_session(self, settings: Optional[Dict[str, Any]] = None):
+        """
+        Raw psycopg2 connection in one transaction tuned for bulk loading
+        
+        Settings are applied with SET LOCAL, so they end with the transaction
+        and never leak into the pooled connection. Commits on success and
+        rolls back on error.
+        
+        Args:
+            settings: Server settings for the transaction. If None, uses
+                etl.bulk_load_settings from config
+        """
+        if settings is None:
+            settings = get_etl_config().get('bulk_load_settings', {})
+        
+        try:
+            with self._raw_transaction() as raw:
+                with raw.cursor() as cur:
+                    for name, value in settings.items():
+                        cur.execute(f"SET LOCAL {name} = %s", (str(value),))
+                yield raw
+        except Exception as e:
+            logger.error(f"Bulk load session failed: {str(e)}")
+            raise
+    
+    def copy_dataframe(self, df: pd.DataFrame, table_name: str, binary: bool = False, conn=None) -> None:
+        """
+        Bulk load DataFrame into an existing table using PostgreSQL COPY
+        
+        Args:
+            df: DataFrame to load (column names must match table columns)
+            table_name: Target table name
+            binary: Use binary COPY when every target column is a fixed-width
+                type without nulls; otherwise falls back to CSV
+            conn: Raw connection from bulk_load_session; the caller owns the
+                transaction. If None, a pooled connection is used and committed
+        """
+        columns = ', '.join(df.columns)
+        
+        payload = None
+        if binary:
+            payload = self._encode_binary_copy(df, self.get_column_types(table_name))
+            if payload is None:
+                logger.debug(f"Binary COPY not supported for {table_name}, using CSV")
+        
+        if payload is not None:
+            buf = io.BytesIO(payload)
+            copy_sql = f"COPY {table_name} ({columns}) FROM STDIN WITH (FORMAT BINARY)"
+        else:
+            # Stream CSV in row chunks instead of materializing the whole frame as text
+            buf = _DataFrameCSVStream(df)
+            copy_sql = f"COPY {table_name} ({columns}) FROM STDIN WITH (FORMAT CSV, NULL '\\N')"
+        
+        try:
+            with self._raw_transaction(conn) as raw, raw.cursor() as cur:
+                cur.copy_expert(copy_sql, buf, size=COPY_BUFFER_SIZE)
+            logger.info(f"Copied {len(df)} rows into {table_name}")
+        except Exception as e:
+            logger.error(f"Failed to copy DataFrame into {table_name}: {str(e)}")
+            raise
+
+    def insert_values(self, df: pd.DataFrame, table_name: str, page_size: int = 1000, conn=None) -> None:
+        """
+        Insert DataFrame with multi-row INSERT statements (execute_values)
+        
+        Used where COPY is not wanted; each page of rows is sent as a single
+        INSERT ... VALUES statement instead of one statement per row.
+        
+        Args:
+            df: DataFrame to insert (column names must match table columns)
+            table_name: Target table name
+            page_size: Number of rows per INSERT statement
+            conn: Raw connection from bulk_load_session; the caller owns the
+                transaction. If None, a pooled connection is used and committed
+        """
+        insert_sql = f"INSERT INTO {table_name} ({', '.join(df.columns)}) VALUES %s"
+        rows = df.itertuples(index=False, name=None)
+        
+        try:
+            with self._raw_transaction(conn) as raw, raw.cursor() as cur:
+                psycopg2.extras.execute_values(cur, insert_sql, rows, page_size=page_size)
+            logger.info(f"Inserted {len(df)} rows into {table_name}")
+        except Exception as e:
+            logger.error(f"Failed to insert DataFrame into {table_name}: {str(e)}")
+            raise
+    
+    def copy_query_to_csv(self, query: str, file_path) -> None:
+        """
+        Write query results straight to a CSV file with COPY ... TO STDOUT
+        
+        Rows are streamed from the server into the file, so memory use does
+        not grow with the result size.
+        
+        Args:
+            query: SELECT query (without trailing semicolon)
+            file_path: Target CSV file, written with a header row
+        """
+        copy_sql = f"COPY ({query}) TO STDOUT WITH (FORMAT CSV, HEADER)"
+        try:
+            with self._raw_transaction() as raw, raw.cursor() as cur, \
+                    open(file_path, 'wb', buffering=FILE_BUFFER_SIZE) as file:
+                cur.copy_expert(copy_sql, file, size=COPY_BUFFER_SIZE)
+        except Exception as e:
+            logger.error(f"Failed to copy query results to {file_path}: {str(e)}")
+            raise
+    
+    def get_column_types(self, table_name: str) -> Dict[str, str]:
+        """
+        Get column types of a table or view from the catalog (cached per table)
+        
+        Args:
+            table_name: Table or view name
+            
+        Returns:
+            Dictionary mapping column name to format_type() string, in column order
+        """
+        if table_name not in self._column_types:
+            types = self.execute_query(
+                """
+                SELECT attname, format_type(atttypid, atttypmod) AS type_name
+                FROM pg_attribute
+                WHERE attrelid = CAST(:table_name AS regclass)
+                  AND attnum > 0 AND NOT attisdropped
+                ORDER BY attnum
+                """,
+                params={'table_name': table_name}
+            )
+            self._column_types[table_name] = dict(zip(types['attname'], types['type_name']))
+        return self._column_types[table_name]
+    
+    @staticmethod
+    def _encode_binary_copy(df: pd.DataFrame, column_types: Dict[str, str]) -> Optional[bytes]:
+        """
+        Encode DataFrame in PostgreSQL binary COPY format using a numpy record array
+        
+        Args:
+            df: DataFrame to encode
+            column_types: Target column types from get_column_types
+            
+        Returns:
+            Binary COPY payload, or None if a column cannot be encoded
+        """
+        fields = [('field_count', '>i2')]
+        values = []
+        for i, col in enumerate(df.columns):
+            pg_type = column_types.get(col)
+            fmt = BINARY_COPY_TYPES.get(pg_type)
+            series = df[col]
+            if fmt is None or series.isna().any():
+                return None
+            
+            if pg_type == 'date':
+                days = pd.to_datetime(series).to_numpy(dtype='datetime64[D]').astype('int64')
+                data = days - PG_EPOCH_DAYS
+            elif pg_type == 'time without time zone':
+                if pd.api.types.is_datetime64_any_dtype(series):
+                    delta = series - series.dt.normalize()
+                else:
+                    delta = pd.to_timedelta(series.astype(str))
+                data = delta.to_numpy(dtype='timedelta64[us]').astype('int64')
+            else:
+                data = series.to_numpy()
+                if fmt.startswith('>i'):
+                    if not pd.api.types.is_integer_dtype(data):
+                        return None
+                    bounds = np.iinfo(fmt)
+                    if len(data) and (data.min() < bounds.min or data.max() > bounds.max):
+                        return None
+                elif fmt.startswith('>f'):
+                    # Text columns would fail numpy's float conversion; CSV handles them
+                    if not (pd.api.types.is_float_dtype(data) or pd.api.types.is_integer_dtype(data)):
+                        return None
+                elif not pd.api.types.is_bool_dtype(data):
+                    return None
+
+            fields.append((f'len_{i}', '>i4'))
+            fields.append((f'val_{i}', fmt))
+            values.append((f'len_{i}', f'val_{i}', np.dtype(fmt).itemsize, data))
+        
+        records = np.empty(len(df), dtype=fields)
+        records['field_count'] = len(df.columns)
+        for len_field, val_field, size, data in values:
+            records[len_field] = size
+            records[val_field] = data
+        
+        return PGCOPY_HEADER + records.tobytes() + PGCOPY_TRAILER
+    
+    def load_csv_direct(self, csv_path, staging_table: str, columns: Optional[List[str]] = None) -> int:
+        """
+        Replace staging table contents with a CSV file using COPY, bypassing pandas
+        
+        Args:
+            csv_path: Path to CSV file with a header row
+            staging_table: Target staging table name
+            columns: Staging columns in CSV column order (all columns if None)
+            
+        Returns:
+            Number of rows copied
+        """
+        column_list = f" ({', '.join(columns)})" if columns else ""
+        copy_sql = f"COPY {staging_table}{column_list} FROM STDIN WITH (FORMAT CSV, HEADER)"
+        
+        try:
+            with self._raw_transaction() as raw, raw.cursor() as cur, open(csv_path, 'rb') as fh:
+                cur.execute(f"TRUNCATE TABLE {staging_table} RESTART IDENTITY")
+                cur.copy_expert(copy_sql, fh)
+                row_count = cur.rowcount
+            logger.info(f"Copied {row_count} rows from {csv_path} into {staging_table}")
+            return row_count
+        except Exception as e:
+            logger.error(f"Failed to copy {csv_path} into {staging_table}: {str(e)}")
+            raise
 
 def test_connection() -> bool:
     """
     Test database connection
     
+    Uses the shared pooled engine from get_db(), so the connection opened
+    here stays in the pool for the ETL steps that follow.
+    
     Returns:
         True if connection successful, False otherwise
     """
     try:
-        db = DatabaseConnection()
-        with db.get_connection() as conn:
-            from sqlalchemy import text
+        with get_db().get_connection() as conn:
             result = conn.execute(text("SELECT 1")).fetchone()
             logger.info("Database connection test successful")
             return True
@@ -122,5 +475,12 @@ def test_connection() -> bool:
         logger.error(f"Database connection test failed: {str(e)}")
         return False
 
-# Global database instance
-db_connection = DatabaseConnection()
+@functools.lru_cache(maxsize=1)
+def get_db() -> DatabaseConnection:
+    """
+    Get the shared database instance, created on first use
+    
+    Returns:
+        DatabaseConnection shared across the process
+    """
+    return DatabaseConnection()
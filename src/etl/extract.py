@@ -5,11 +5,14 @@ Handles data extraction from CSV files
 """
 
 import pandas as pd
+import numpy as np
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator
+import functools
+import contextlib
 import os
 
-from ..utils.config import get_data_paths, get_data_quality_config
+from ..utils.config import get_data_paths, get_data_quality_config, get_etl_config
 from ..utils.logging import get_logger, log_function_call
 
 logger = get_logger(__name__)
@@ -20,10 +23,16 @@ class DataExtractor:
     def __init__(self):
         self.data_paths = get_data_paths()
         self.quality_config = get_data_quality_config()
+        self.etl_config = get_etl_config()
         self.required_columns = self.quality_config['required_columns']
+        self._required_set = frozenset(self.required_columns)
+        self.dtypes = self.quality_config.get('dtypes')
+        self.missing_values = None
+        self._discovered_csv = None
+        self._supermarket_csv = None
     
     @log_function_call
-    def extract_csv(self, file_path: Optional[str] = None) -> pd.DataFrame:
+    def extract_csv(self, file_path: Optional[Path] = None) -> pd.DataFrame:
         """
         Extract data from CSV file
         
@@ -34,20 +43,11 @@ class DataExtractor:
             DataFrame with extracted data
         """
         if file_path is None:
-            # Look for CSV files in raw data directory
-            raw_path = self.data_paths['raw']
-            csv_files = list(raw_path.glob("*.csv"))
-            
-            if not csv_files:
-                raise FileNotFoundError(f"No CSV files found in {raw_path}")
-            
-            # Use the first CSV file found
-            file_path = csv_files[0]
-            logger.info(f"Using CSV file: {file_path}")
+            file_path = self._discover_csv()
         
         try:
             # Read CSV file
-            df = pd.read_csv(file_path)
+            df = pd.read_csv(os.fspath(file_path))
             logger.info(f"Successfully loaded {len(df)} records from {file_path}")
             
             # Validate required columns
@@ -59,6 +59,30 @@ class DataExtractor:
             logger.error(f"Failed to extract data from {file_path}: {str(e)}")
             raise
     
+    def _discover_csv(self) -> Path:
+        """
+        Find the first CSV file in the raw data directory (cached)
+        
+        Returns:
+            Path to the discovered CSV file
+        """
+        if self._discovered_csv is None:
+            # os.scandir avoids building a Path object per directory entry
+            raw_path = self.data_paths['raw']
+            with os.scandir(raw_path) as entries:
+                csv_name = next(
+                    (entry.name for entry in entries
+                     if entry.name.endswith('.csv') and entry.is_file()),
+                    None
+                )
+            
+            if csv_name is None:
+                raise FileNotFoundError(f"No CSV files found in {raw_path}")
+            
+            self._discovered_csv = raw_path / csv_name
+            logger.info(f"Using CSV file: {self._discovered_csv}")
+        return self._discovered_csv
+    
     def _validate_columns(self, df: pd.DataFrame) -> None:
         """
         Validate that all required columns are present
@@ -66,10 +90,10 @@ class DataExtractor:
         Args:
             df: DataFrame to validate
         """
-        missing_columns = set(self.required_columns) - set(df.columns)
+        missing_columns = self._required_set.difference(df.columns)
         
         if missing_columns:
-            raise ValueError(f"Missing required columns: {missing_columns}")
+            raise ValueError(f"Missing required columns: {set(missing_columns)}")
         
         logger.info("All required columns present")
     
@@ -82,15 +106,10 @@ class DataExtractor:
             DataFrame with supermarket sales data
         """
         try:
-            # Look for SuperMarketAnalysis.csv
-            raw_path = self.data_paths['raw']
-            csv_file = raw_path / "SuperMarketAnalysis.csv"
+            csv_file = self._supermarket_csv_path()
             
-            if not csv_file.exists():
-                raise FileNotFoundError(f"SuperMarketAnalysis.csv not found in {raw_path}")
-            
-            # Read the CSV file
-            df = pd.read_csv(csv_file)
+            # Read the CSV file with an explicit schema
+            df = self._read_csv(csv_file)
             logger.info(f"Loaded Supermarket Sales data: {len(df)} records")
             
             # Basic data validation
@@ -102,6 +121,194 @@ class DataExtractor:
             logger.error(f"Failed to extract supermarket data: {str(e)}")
             raise
     
+    @log_function_call
+    def extract_supermarket_chunks(self, chunksize: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """
+        Extract Supermarket Sales data in chunks to bound peak memory
+        
+        Args:
+            chunksize: Rows per chunk. If None, uses etl.chunk_size from config
+            
+        Returns:
+            Iterator of DataFrame chunks
+        """
+        csv_file = self._supermarket_csv_path()
+        
+        if chunksize is None:
+            chunksize = self.etl_config.get('chunk_size', 100_000)
+        
+        # pd.read_csv only supports chunksize with the C parser, so the other
+        # engines stream batches through their own readers
+        engine = self.etl_config.get('csv_engine', 'c')
+        if engine == 'pyarrow':
+            reader = self._arrow_chunks(csv_file, chunksize)
+        elif engine == 'polars':
+            reader = self._polars_chunks(csv_file, chunksize)
+        else:
+            reader = pd.read_csv(os.fspath(csv_file), chunksize=chunksize, **self._read_options())
+        return self._validated_chunks(reader)
+    
+    def _supermarket_csv_path(self) -> Path:
+        """
+        Resolve SuperMarketAnalysis.csv once per extractor
+        
+        Returns:
+            Path to the raw Supermarket Sales CSV file
+        """
+        if self._supermarket_csv is None:
+            # Look for SuperMarketAnalysis.csv
+            raw_path = self.data_paths['raw']
+            csv_file = raw_path / "SuperMarketAnalysis.csv"
+            
+            if not csv_file.exists():
+                raise FileNotFoundError(f"SuperMarketAnalysis.csv not found in {raw_path}")
+            
+            self._supermarket_csv = csv_file
+        return self._supermarket_csv
+    
+    def _arrow_chunks(self, csv_file: Path, chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Stream the CSV with pyarrow's multi-threaded reader in chunks of chunksize rows
+        
+        Args:
+            csv_file: Path to CSV file
+            chunksize: Rows per chunk
+            
+        Returns:
+            Iterator of DataFrame chunks with the configured dtypes
+        """
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+        
+        # Explicit column types, since the streaming reader only infers them
+        # from the first block
+        arrow_types = {
+            'float64': pa.float64(),
+            'float32': pa.float32(),
+            'int64': pa.int64(),
+            'int32': pa.int32(),
+            'string': pa.string(),
+            'category': pa.string(),
+        }
+        convert_options = pa_csv.ConvertOptions(
+            include_columns=self.required_columns,
+            column_types={col: arrow_types[dtype] for col, dtype in (self.dtypes or {}).items()
+                          if dtype in arrow_types}
+        )
+        
+        pending = None
+        with pa_csv.open_csv(os.fspath(csv_file), convert_options=convert_options) as reader:
+            for batch in reader:
+                batch_table = pa.Table.from_batches([batch])
+                pending = batch_table if pending is None else pa.concat_tables([pending, batch_table])
+                while pending.num_rows >= chunksize:
+                    yield self._apply_dtypes(pending.slice(0, chunksize).to_pandas())
+                    pending = pending.slice(chunksize)
+        if pending is not None and pending.num_rows:
+            yield self._apply_dtypes(pending.to_pandas())
+    
+    def _polars_chunks(self, csv_file: Path, chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Stream the CSV with polars in batches of about chunksize rows
+        
+        Args:
+            csv_file: Path to CSV file
+            chunksize: Rows per chunk
+            
+        Returns:
+            Iterator of DataFrame chunks with the configured dtypes
+        """
+        import polars as pl
+        
+        batches = (
+            pl.scan_csv(csv_file, schema_overrides=self._polars_schema(pl))
+            .select(self.required_columns)
+            .collect_batches(chunk_size=chunksize)
+        )
+        for batch in batches:
+            yield self._apply_dtypes(batch.to_pandas())
+    
+    def _apply_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Cast a parsed frame to the configured dtypes, if any"""
+        return df.astype(self.dtypes) if self.dtypes else df
+    
+    def _validated_chunks(self, reader) -> Iterator[pd.DataFrame]:
+        """Run data quality validation on each chunk as it is read"""
+        # Both pandas readers and generators close cleanly if iteration stops early
+        with contextlib.closing(reader):
+            for chunk in reader:
+                self._validate_data_quality(chunk)
+                yield chunk
+    
+    def _read_csv(self, csv_file: Path) -> pd.DataFrame:
+        """
+        Read the whole CSV with the parser named by etl.csv_engine
+        
+        Args:
+            csv_file: Path to CSV file
+            
+        Returns:
+            DataFrame with the configured columns and dtypes
+        """
+        engine = self.etl_config.get('csv_engine', 'c')
+        
+        if engine == 'polars':
+            # Multi-threaded Rust parser; requires polars to be installed
+            import polars as pl
+            
+            df = pl.read_csv(
+                csv_file,
+                columns=self.required_columns,
+                schema_overrides=self._polars_schema(pl)
+            ).to_pandas()
+            return self._apply_dtypes(df)
+        
+        if engine == 'pyarrow' and self.dtypes:
+            # Categoricals built by the pyarrow engine share read-only Arrow
+            # buffers, so parse them as strings and convert afterwards
+            options = self._read_options()
+            categories = {col: dtype for col, dtype in self.dtypes.items() if dtype == 'category'}
+            options['dtype'] = {col: ('string' if col in categories else dtype)
+                                for col, dtype in self.dtypes.items()}
+            df = pd.read_csv(os.fspath(csv_file), engine=engine, **options)
+            return df.astype(categories)
+        
+        return pd.read_csv(os.fspath(csv_file), engine=engine, **self._read_options())
+    
+    def _polars_schema(self, pl) -> Dict[str, Any]:
+        """
+        Map configured numeric dtypes to polars types so values are parsed once
+        
+        Args:
+            pl: polars module
+            
+        Returns:
+            Dictionary usable as schema_overrides
+        """
+        polars_types = {
+            'float64': pl.Float64,
+            'float32': pl.Float32,
+            'int64': pl.Int64,
+            'int32': pl.Int32,
+        }
+        return {
+            col: polars_types[dtype]
+            for col, dtype in (self.dtypes or {}).items()
+            if dtype in polars_types
+        }
+    
+    def _read_options(self) -> Dict[str, Any]:
+        """
+        Build pd.read_csv options from the configured schema
+        
+        Returns:
+            Dictionary with usecols and dtype arguments
+        """
+        options = {'usecols': self.required_columns}
+        if self.dtypes:
+            options['dtype'] = self.dtypes
+        return options
+    
     def _validate_data_quality(self, df: pd.DataFrame) -> None:
         """
         Validate data quality
@@ -109,15 +316,19 @@ class DataExtractor:
         Args:
             df: DataFrame to validate
         """
-        # Check for missing values
-        missing_values = df.isnull().sum()
-        if missing_values.sum() > 0:
-            logger.warning(f"Found missing values: {missing_values[missing_values > 0].to_dict()}")
+        # Check for missing values in required columns; per-column counts
+        # are only computed when there is something to report
+        null_mask = df[self.required_columns].isna()
+        self.missing_values = None
+        if null_mask.to_numpy().any():
+            self.missing_values = null_mask.sum()
+            logger.warning(f"Found missing values: {self.missing_values[self.missing_values > 0].to_dict()}")
         
-        # Check sales amount range
-        if 'Sales' in df.columns:
-            min_sales = df['Sales'].min()
-            max_sales = df['Sales'].max()
+        # Check sales amount range on the raw numpy buffer
+        if 'Sales' in df.columns and not df.empty:
+            sales = df['Sales'].to_numpy(dtype='float64')
+            min_sales = np.nanmin(sales)
+            max_sales = np.nanmax(sales)
             
             if min_sales < self.quality_config['min_sales_amount']:
                 logger.warning(f"Sales amount below minimum: {min_sales}")
@@ -127,6 +338,11 @@ class DataExtractor:
         
         logger.info("Data quality validation completed")
 
+@functools.lru_cache(maxsize=1)
+def _get_extractor() -> DataExtractor:
+    """Shared extractor so config and file discovery happen once per process"""
+    return DataExtractor()
+
 def extract_data(file_path: Optional[str] = None) -> pd.DataFrame:
     """
     Main function to extract data
@@ -137,8 +353,19 @@ def extract_data(file_path: Optional[str] = None) -> pd.DataFrame:
     Returns:
         DataFrame with extracted data
     """
-    extractor = DataExtractor()
-    return extractor.extract_supermarket_data()
+    return _get_extractor().extract_supermarket_data()
+
+def extract_data_chunks(chunksize: Optional[int] = None) -> Iterator[pd.DataFrame]:
+    """
+    Main function to extract data in chunks
+    
+    Args:
+        chunksize: Rows per chunk
+        
+    Returns:
+        Iterator of DataFrame chunks
+    """
+    return _get_extractor().extract_supermarket_chunks(chunksize)
 
 if __name__ == "__main__":
     # Test extraction
@@ -3,20 +3,151 @@ Load module for Supermarket Sales ETL Pipeline
 Handles data loading into PostgreSQL data warehouse
 """
 
+import numpy as np
 import pandas as pd
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, Future
 
-from ..database.connection import db_connection
+from ..database.connection import get_db
+from ..utils.config import get_etl_config
 from ..utils.logging import get_logger, log_function_call
+from ..utils.files import FILE_BUFFER_SIZE
 
 logger = get_logger(__name__)
 
+# Staging table fed straight from the raw CSV by load_csv_direct
+STAGING_TABLE = 'stg_supermarket_sales'
+STAGING_COLUMNS = [
+    'invoice_id', 'branch', 'city', 'customer_type', 'gender', 'product_line',
+    'unit_price', 'quantity', 'tax_5_percent', 'sales', 'date', 'time',
+    'payment', 'cogs', 'gross_margin_percentage', 'gross_income', 'rating'
+]
+
+# Dimensional model built in SQL from v_stg_supermarket_sales.
+# Surrogate keys follow first appearance in the file, like DataTransformer.
+DIRECT_LOAD_SQL = [
+    ('dim_customer', """
+        INSERT INTO dim_customer (customer_id, customer_type, gender)
+        SELECT ROW_NUMBER() OVER (ORDER BY MIN(row_id)), customer_type, gender
+        FROM v_stg_supermarket_sales
+        GROUP BY customer_type, gender
+    """),
+    ('dim_product', """
+        INSERT INTO dim_product (product_id, product_line, unit_price)
+        SELECT ROW_NUMBER() OVER (ORDER BY MIN(row_id)), product_line, unit_price
+        FROM v_stg_supermarket_sales
+        GROUP BY product_line, unit_price
+    """),
+    ('dim_time', """
+        INSERT INTO dim_time (time_id, date, time, year, month, day, quarter, weekday, is_weekend)
+        SELECT ROW_NUMBER() OVER (ORDER BY MIN(row_id)), date, time,
+               EXTRACT(YEAR FROM date), EXTRACT(MONTH FROM date), EXTRACT(DAY FROM date),
+               EXTRACT(QUARTER FROM date), EXTRACT(ISODOW FROM date) - 1,
+               EXTRACT(ISODOW FROM date) >= 6
+        FROM v_stg_supermarket_sales
+        GROUP BY date, time
+    """),
+    ('dim_branch', """
+        INSERT INTO dim_branch (branch_id, branch, city)
+        SELECT ROW_NUMBER() OVER (ORDER BY MIN(row_id)), branch, city
+        FROM v_stg_supermarket_sales
+        GROUP BY branch, city
+    """),
+    ('dim_payment', """
+        INSERT INTO dim_payment (payment_id, payment_method)
+        SELECT ROW_NUMBER() OVER (ORDER BY MIN(row_id)), payment_method
+        FROM v_stg_supermarket_sales
+        GROUP BY payment_method
+    """),
+    ('fact_sales', """
+        INSERT INTO fact_sales (invoice_id, customer_id, product_id, time_id, branch_id, payment_id,
+                                quantity, tax_5_percent, sales, cogs, gross_margin_percentage,
+                                gross_income, rating)
+        SELECT s.invoice_id, dc.customer_id, dp.product_id, dt.time_id, db.branch_id, dpm.payment_id,
+               s.quantity, s.tax_5_percent, s.sales, s.cogs, s.gross_margin_percentage,
+               s.gross_income, s.rating
+        FROM v_stg_supermarket_sales s
+        JOIN dim_customer dc ON dc.customer_type = s.customer_type AND dc.gender = s.gender
+        JOIN dim_product dp ON dp.product_line = s.product_line AND dp.unit_price = s.unit_price
+        JOIN dim_time dt ON dt.date = s.date AND dt.time = s.time
+        JOIN dim_branch db ON db.branch = s.branch AND db.city = s.city
+        JOIN dim_payment dpm ON dpm.payment_method = s.payment_method
+        ORDER BY s.row_id
+    """),
+]
+
+# Fact batches between progress log lines
+LOG_EVERY_BATCHES = 100
+
+# Warehouse exports are ordered so files do not depend on how rows were
+# loaded: tables by their surrogate key (first column), the summary view by
+# fact load order (invoice_id is unique in fact_sales). {columns} is filled
+# in by DataLoader._export_columns for the relation aliased as t
+TABLE_EXPORT_SQL = "SELECT {columns} FROM {table} t ORDER BY 1"
+SALES_SUMMARY_EXPORT_SQL = """
+    SELECT {columns} FROM v_sales_summary t
+    JOIN fact_sales fs USING (invoice_id)
+    ORDER BY fs.sales_id
+"""
+
+# Drops the trailing zeros of numeric text (76.40 -> 76.4, 10.00 -> 10.0)
+NUMERIC_TRIM_PATTERN = r"(\.[0-9]*?[0-9])0+$"
+
+DIMENSION_TABLES = ['dim_customer', 'dim_product', 'dim_time', 'dim_branch', 'dim_payment']
+
+# Export directory for warehouse tables and PowerBI files
+WAREHOUSE_DIR = Path(__file__).parent.parent.parent / "data" / "warehouse"
+
+# Tables exported to data/warehouse after each load
+WAREHOUSE_TABLES = DIMENSION_TABLES + ['fact_sales']
+
+# PowerBI ready aggregates, computed in one scan of v_sales_summary.
+# GROUPING() sets a bit for every listed column that is not grouped, in
+# argument order, so each grouping set gets its own grouping_id.
+POWERBI_AGGREGATE_SQL = """
+    SELECT branch, city, product_line, year, month, customer_type, gender,
+           GROUPING(branch, product_line, year, customer_type) as grouping_id,
+           SUM(sales) as total_sales,
+           COUNT(*) as transaction_count,
+           AVG(sales) as avg_sales,
+           AVG(unit_price) as avg_unit_price,
+           AVG(rating) as avg_rating
+    FROM v_sales_summary 
+    GROUP BY GROUPING SETS ((branch, city), (product_line), (year, month), (customer_type, gender))
+"""
+
+# PowerBI exports as (file name, grouping_id, columns, sort columns, ascending)
+POWERBI_EXPORTS = [
+    ('sales_by_branch', 0b0111,
+     ['branch', 'city', 'total_sales', 'transaction_count', 'avg_sales'],
+     ['total_sales'], False),
+    ('sales_by_product', 0b1011,
+     ['product_line', 'total_sales', 'transaction_count', 'avg_unit_price'],
+     ['total_sales'], False),
+    ('monthly_sales_trend', 0b1101,
+     ['year', 'month', 'total_sales', 'transaction_count'],
+     ['year', 'month'], True),
+    ('customer_analysis', 0b1110,
+     ['customer_type', 'gender', 'total_sales', 'transaction_count', 'avg_rating'],
+     ['total_sales'], False),
+]
+
 class DataLoader:
     """Data loading class"""
     
     def __init__(self):
-        self.db = db_connection
+        self.db = get_db()
+        self.etl_config = get_etl_config()
+        self.binary_copy = self.etl_config.get('copy_format', 'csv') == 'binary'
+        self.load_method = self.etl_config.get('load_method', 'copy')
+        self.values_page_size = self.etl_config.get('values_page_size', 1000)
+        
+        # Fact batches can skip FK triggers (session_replication_role needs
+        # superuser); SET LOCAL scopes it to each batch transaction
+        self.fact_load_settings = dict(self.etl_config.get('bulk_load_settings', {}))
+        if self.etl_config.get('disable_fact_triggers', False):
+            self.fact_load_settings['session_replication_role'] = 'replica'
     
     @log_function_call
     def load_data(self, transformed_data: Dict[str, pd.DataFrame]) -> None:
@@ -29,22 +160,62 @@ class DataLoader:
         try:
             logger.info("Starting data loading process")
             
-            # Clear fact table first to avoid FK constraint violations
-            self._clear_table('fact_sales')
+            # Clear the fact table and the dimensions being reloaded in one
+            # statement, so FK references never block the clear
+            self._clear_tables(['fact_sales'] + [table for table in DIMENSION_TABLES if table in transformed_data])
             
             # Load dimension tables first
             self._load_dimensions(transformed_data)
             
-            # Load fact table
-            self._load_fact_table(transformed_data)
+            with ThreadPoolExecutor(max_workers=self.etl_config.get('export_workers', 8)) as executor:
+                # Dimension tables are final once loaded, so their exports run
+                # while the fact table loads
+                dimension_exports = self._submit_exports(
+                    executor, [(table, self._export_sql(table)) for table in DIMENSION_TABLES]
+                )
+                
+                # Load fact table
+                self._load_fact_table(transformed_data)
+                
+                logger.info("Data loading completed successfully")
+                
+                # Export the rest of the data warehouse to files
+                self._export_warehouse_data(executor, dimension_exports)
+            
+        except Exception as e:
+            logger.error(f"Data loading failed: {str(e)}")
+            raise
+    
+    @log_function_call
+    def load_csv_direct(self, csv_path) -> None:
+        """
+        Load the raw CSV into the warehouse without going through pandas
+        
+        The file is copied into the staging table by PostgreSQL's own CSV
+        parser and the dimensional model is built with INSERT ... SELECT.
+        
+        Args:
+            csv_path: Path to SuperMarketAnalysis.csv
+        """
+        try:
+            logger.info("Starting direct CSV load")
+            
+            # Clear fact and dimension tables in one statement
+            self._clear_tables([table_name for table_name, _ in DIRECT_LOAD_SQL])
             
-            logger.info("Data loading completed successfully")
+            self.db.load_csv_direct(csv_path, STAGING_TABLE, STAGING_COLUMNS)
+            
+            for table_name, sql in DIRECT_LOAD_SQL:
+                self.db.execute_command(sql)
+                logger.info(f"Loaded {table_name} from {STAGING_TABLE}")
+            
+            logger.info("Direct CSV load completed successfully")
             
             # Export data warehouse to files
             self._export_warehouse_data()
             
         except Exception as e:
-            logger.error(f"Data loading failed: {str(e)}")
+            logger.error(f"Direct CSV load failed: {str(e)}")
             raise
     
     def _load_dimensions(self, data: Dict[str, pd.DataFrame]) -> None:
@@ -56,23 +227,12 @@ class DataLoader:
         """
         logger.info("Loading dimension tables")
         
-        dimension_tables = [
-            'dim_customer', 'dim_product', 'dim_time', 
-            'dim_branch', 'dim_payment'
-        ]
-        
-        for table_name in dimension_tables:
+        for table_name in DIMENSION_TABLES:
             if table_name in data:
                 try:
-                    # Clear existing data (for development)
-                    self._clear_table(table_name)
-                    
-                    # Insert new data
-                    self.db.insert_dataframe(
-                        data[table_name], 
-                        table_name, 
-                        if_exists='append'
-                    )
+                    # Insert new data (tables were cleared in load_data)
+                    with self.db.bulk_load_session() as conn:
+                        self._bulk_insert(data[table_name], table_name, conn)
                     
                     logger.info(f"Loaded {len(data[table_name])} records into {table_name}")
                     
@@ -93,19 +253,45 @@ class DataLoader:
             try:
                 # Note: fact_sales is already cleared in load_data() to avoid FK constraints
                 
-                # Insert data in batches to avoid parameter limit
-                batch_size = 50
-                df = data['fact_sales']
-                total_records = len(df)
+                # Secondary indexes are rebuilt once after the load instead of
+                # being updated for every inserted row
+                dropped_indexes = []
+                if self.etl_config.get('drop_fact_indexes', True):
+                    dropped_indexes = self._drop_indexes('fact_sales')
                 
-                for i in range(0, total_records, batch_size):
-                    batch_df = df.iloc[i:i+batch_size]
-                    self.db.insert_dataframe(
-                        batch_df, 
-                        'fact_sales', 
-                        if_exists='append'
-                    )
-                    logger.info(f"Loaded batch {i//batch_size + 1}: {len(batch_df)} records")
+                try:
+                    # Insert data in batches; batches are independent once dimensions
+                    # are loaded, so several COPY workers run them on separate connections
+                    batch_size = self.etl_config.get('batch_size', 10_000)
+                    total_records = len(data['fact_sales'])
+                    load_workers = self.etl_config.get('load_workers', 1)
+                    
+                    # Batches commit in any order, so sales_id is assigned here in
+                    # file order rather than by the sequence at insert time
+                    df = data['fact_sales'].assign(sales_id=np.arange(1, total_records + 1))
+                    
+                    with ThreadPoolExecutor(max_workers=load_workers) as executor:
+                        futures = [
+                            executor.submit(self._load_fact_batch, df.iloc[i:i+batch_size], i // batch_size + 1)
+                            for i in range(0, total_records, batch_size)
+                        ]
+                        for future in futures:
+                            future.result()
+                    
+                    # Keep later inserts that rely on the SERIAL default past the loaded ids
+                    if total_records:
+                        self.db.execute_command(
+                            "SELECT setval(pg_get_serial_sequence('fact_sales', 'sales_id'), :last_id)",
+                            {'last_id': total_records}
+                        )
+                finally:
+                    # Logged rather than raised, so a failed rebuild never masks
+                    # the load error. Indexes missing after a failure or a killed
+                    # run are restored by re-running scripts/setup_database.sql
+                    try:
+                        self._create_indexes(dropped_indexes)
+                    except Exception as e:
+                        logger.error(f"Failed to recreate indexes on fact_sales: {str(e)}")
                 
                 logger.info(f"Loaded {total_records} records into fact_sales")
                 
@@ -113,114 +299,222 @@ class DataLoader:
                 logger.error(f"Failed to load fact_sales: {str(e)}")
                 raise
     
-    def _export_warehouse_data(self):
-        """Export data warehouse to files for PowerBI and analysis"""
+    def _load_fact_batch(self, batch_df: pd.DataFrame, batch_number: int) -> None:
+        """
+        Load one fact table batch (runs in a worker thread)
+        
+        Args:
+            batch_df: Slice of the fact table
+            batch_number: 1-based batch number for logging
+        """
+        with self.db.bulk_load_session(self.fact_load_settings) as conn:
+            self._bulk_insert(batch_df, 'fact_sales', conn)
+        # Progress is logged every LOG_EVERY_BATCHES batches; the total is logged at the end
+        if batch_number % LOG_EVERY_BATCHES == 0:
+            logger.info(f"Loaded batch {batch_number}: {len(batch_df)} records")
+    
+    def _drop_indexes(self, table_name: str) -> List[str]:
+        """
+        Drop the secondary indexes of a table before a bulk load
+        
+        Indexes backing a constraint (primary key, unique) are kept.
+        
+        Args:
+            table_name: Table name
+            
+        Returns:
+            CREATE INDEX statements for the dropped indexes
+        """
+        indexes = self.db.execute_query(
+            """
+            SELECT i.indexrelid::regclass::text AS index_name,
+                   pg_get_indexdef(i.indexrelid) AS index_def
+            FROM pg_index i
+            WHERE i.indrelid = CAST(:table_name AS regclass)
+              AND NOT i.indisunique
+              AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = i.indexrelid)
+            """,
+            params={'table_name': table_name}
+        )
+        if indexes.empty:
+            return []
+        
+        self.db.execute_command(f"DROP INDEX IF EXISTS {', '.join(indexes['index_name'])}")
+        logger.info(f"Dropped {len(indexes)} indexes on {table_name}")
+        return indexes['index_def'].tolist()
+    
+    def _create_indexes(self, index_defs: List[str]) -> None:
+        """
+        Recreate indexes dropped by _drop_indexes
+        
+        Args:
+            index_defs: CREATE INDEX statements
+        """
+        if not index_defs:
+            return
+        
+        # The table is not in use yet, so a plain build is used rather than
+        # CREATE INDEX CONCURRENTLY, which needs two table scans
+        with self.db.bulk_load_session() as conn:
+            with conn.cursor() as cur:
+                for index_def in index_defs:
+                    cur.execute(index_def)
+        logger.info(f"Recreated {len(index_defs)} indexes")
+    
+    def _bulk_insert(self, df: pd.DataFrame, table_name: str, conn) -> None:
+        """
+        Write rows with the method named by etl.load_method
+        
+        Args:
+            df: DataFrame to load
+            table_name: Target table name
+            conn: Raw connection from bulk_load_session
+        """
+        if self.load_method == 'values':
+            self.db.insert_values(df, table_name, page_size=self.values_page_size, conn=conn)
+        else:
+            self.db.copy_dataframe(df, table_name, binary=self.binary_copy, conn=conn)
+    
+    def _export_warehouse_data(self, executor: Optional[ThreadPoolExecutor] = None,
+                               submitted: Optional[List[Tuple[str, Future]]] = None):
+        """
+        Export data warehouse to files for PowerBI and analysis
+        
+        Args:
+            executor: Export thread pool to use. If None, a new one is created
+            submitted: (name, future) pairs of exports already running in executor
+        """
+        if executor is None:
+            with ThreadPoolExecutor(max_workers=self.etl_config.get('export_workers', 8)) as executor:
+                return self._export_warehouse_data(executor, submitted)
+        
         try:
-            # Create warehouse directory
-            warehouse_dir = Path(__file__).parent.parent.parent / "data" / "warehouse"
-            warehouse_dir.mkdir(parents=True, exist_ok=True)
+            futures = list(submitted or [])
+            already_submitted = {name for name, _ in futures}
             
-            # Export sales summary view (main export for PowerBI)
-            sales_summary = self.db.execute_query("SELECT * FROM v_sales_summary")
-            sales_summary_file = warehouse_dir / "sales_summary.csv"
-            sales_summary.to_csv(sales_summary_file, index=False)
-            logger.info(f"Exported sales summary to {sales_summary_file}")
+            # Sales summary view (main export for PowerBI) and the individual
+            # dimension and fact tables
+            exports = ['sales_summary'] + WAREHOUSE_TABLES
+            futures += self._submit_exports(
+                executor, [(name, self._export_sql(name)) for name in exports if name not in already_submitted]
+            )
             
-            # Export individual dimension tables
-            dimension_tables = ['dim_customer', 'dim_product', 'dim_time', 'dim_branch', 'dim_payment']
-            for table in dimension_tables:
+            # Create PowerBI ready export
+            futures.append(('PowerBI aggregates', executor.submit(self._create_powerbi_export, WAREHOUSE_DIR)))
+            
+            for name, future in futures:
                 try:
-                    data = self.db.execute_query(f"SELECT * FROM {table}")
-                    file_path = warehouse_dir / f"{table}.csv"
-                    data.to_csv(file_path, index=False)
-                    logger.info(f"Exported {table} to {file_path}")
+                    future.result()
                 except Exception as e:
-                    logger.warning(f"Failed to export {table}: {str(e)}")
-            
-            # Export fact table
-            try:
-                fact_data = self.db.execute_query("SELECT * FROM fact_sales")
-                fact_file = warehouse_dir / "fact_sales.csv"
-                fact_data.to_csv(fact_file, index=False)
-                logger.info(f"Exported fact_sales to {fact_file}")
-            except Exception as e:
-                logger.warning(f"Failed to export fact_sales: {str(e)}")
-            
-            # Create PowerBI ready export
-            self._create_powerbi_export(warehouse_dir)
+                    logger.warning(f"Failed to export {name}: {str(e)}")
             
         except Exception as e:
             logger.error(f"Failed to export warehouse data: {str(e)}")
     
-    def _create_powerbi_export(self, warehouse_dir: Path):
-        """Create PowerBI ready exports with specific queries"""
-        try:
-            # Sales by branch and city
-            branch_sales = self.db.execute_query("""
-                SELECT branch, city, 
-                       SUM(sales) as total_sales,
-                       COUNT(*) as transaction_count,
-                       AVG(sales) as avg_sales
-                FROM v_sales_summary 
-                GROUP BY branch, city
-                ORDER BY total_sales DESC
-            """)
-            branch_sales.to_csv(warehouse_dir / "sales_by_branch.csv", index=False)
+    def _submit_exports(self, executor: ThreadPoolExecutor, exports: List[Tuple[str, str]]) -> List[Tuple[str, Future]]:
+        """
+        Start query exports to data/warehouse/<name>.csv
+        
+        Each export is an independent fetch and file write, so they run
+        concurrently on separate pooled connections.
+        
+        Args:
+            executor: Export thread pool
+            exports: (name, query) pairs
             
-            # Sales by product line
-            product_sales = self.db.execute_query("""
-                SELECT product_line,
-                       SUM(sales) as total_sales,
-                       COUNT(*) as transaction_count,
-                       AVG(unit_price) as avg_unit_price
-                FROM v_sales_summary 
-                GROUP BY product_line
-                ORDER BY total_sales DESC
-            """)
-            product_sales.to_csv(warehouse_dir / "sales_by_product.csv", index=False)
+        Returns:
+            (name, future) pairs
+        """
+        WAREHOUSE_DIR.mkdir(parents=True, exist_ok=True)
+        return [
+            (name, executor.submit(self._export_query, sql, WAREHOUSE_DIR / f"{name}.csv"))
+            for name, sql in exports
+        ]
+    
+    def _export_sql(self, name: str) -> str:
+        """
+        Build the export query for a warehouse table or the sales summary
+        
+        Args:
+            name: 'sales_summary' or a warehouse table name
             
-            # Monthly sales trend
-            monthly_sales = self.db.execute_query("""
-                SELECT year, month,
-                       SUM(sales) as total_sales,
-                       COUNT(*) as transaction_count
-                FROM v_sales_summary 
-                GROUP BY year, month
-                ORDER BY year, month
-            """)
-            monthly_sales.to_csv(warehouse_dir / "monthly_sales_trend.csv", index=False)
+        Returns:
+            Ordered SELECT query for copy_query_to_csv
+        """
+        if name == 'sales_summary':
+            return SALES_SUMMARY_EXPORT_SQL.format(columns=self._export_columns('v_sales_summary'))
+        return TABLE_EXPORT_SQL.format(columns=self._export_columns(name), table=name)
+    
+    def _export_columns(self, relation: str) -> str:
+        """
+        Select list that renders values the way the pandas to_csv exports did
+        
+        COPY writes booleans as t/f and numerics with their full scale, so
+        booleans become True/False and numeric trailing zeros are trimmed.
+        
+        Args:
+            relation: Table or view aliased as t in the export query
             
-            # Customer analysis
-            customer_analysis = self.db.execute_query("""
-                SELECT customer_type, gender,
-                       SUM(sales) as total_sales,
-                       COUNT(*) as transaction_count,
-                       AVG(rating) as avg_rating
-                FROM v_sales_summary 
-                GROUP BY customer_type, gender
-                ORDER BY total_sales DESC
-            """)
-            customer_analysis.to_csv(warehouse_dir / "customer_analysis.csv", index=False)
+        Returns:
+            Comma-separated select list
+        """
+        columns = []
+        for name, pg_type in self.db.get_column_types(relation).items():
+            ref = f"t.{name}"
+            if pg_type == 'boolean':
+                columns.append(f"CASE WHEN {ref} THEN 'True' WHEN NOT {ref} THEN 'False' END AS {name}")
+            elif pg_type.startswith('numeric'):
+                columns.append(f"regexp_replace({ref}::text, '{NUMERIC_TRIM_PATTERN}', '\\1') AS {name}")
+            else:
+                columns.append(ref)
+        return ', '.join(columns)
+    
+    def _export_query(self, sql: str, file_path: Path) -> None:
+        """
+        Stream the result of one query to CSV (runs in a worker thread)
+        
+        Args:
+            sql: Query to export
+            file_path: Target CSV file
+        """
+        self.db.copy_query_to_csv(sql, file_path)
+        logger.info(f"Exported {file_path.stem} to {file_path}")
+    
+    def _create_powerbi_export(self, warehouse_dir: Path):
+        """Create PowerBI ready exports from one GROUPING SETS query"""
+        aggregates = self.db.execute_query(POWERBI_AGGREGATE_SQL)
+        
+        for name, grouping_id, columns, sort_columns, ascending in POWERBI_EXPORTS:
+            export = aggregates.loc[aggregates['grouping_id'] == grouping_id, columns]
+            export = export.sort_values(sort_columns, ascending=ascending, kind='stable')
             
-            logger.info("Created PowerBI ready exports")
+            # Grouping columns of other sets are NULL in the combined result,
+            # which turns the integer year/month columns into floats
+            export = export.astype({col: 'int64' for col in ('year', 'month') if col in columns})
             
-        except Exception as e:
-            logger.error(f"Failed to create PowerBI exports: {str(e)}")
+            with open(warehouse_dir / f"{name}.csv", 'w', buffering=FILE_BUFFER_SIZE, newline='', encoding='utf-8') as file:
+                export.to_csv(file, index=False)
+        
+        logger.info("Created PowerBI ready exports")
     
-    def _clear_table(self, table_name: str) -> None:
+    def _clear_tables(self, table_names: List[str]) -> None:
         """
         Clear table data (for development purposes)
         
+        All tables are truncated in one statement, which is a metadata-only
+        operation, and their identity sequences restart.
+        
         Args:
-            table_name: Name of table to clear
+            table_names: Names of tables to clear
         """
+        tables = ', '.join(table_names)
         try:
             # Only clear if it's a development environment
             # In production, you might want to append or update instead
-            self.db.execute_command(f"DELETE FROM {table_name}")
-            logger.info(f"Cleared table {table_name}")
+            self.db.execute_command(f"TRUNCATE TABLE {tables} RESTART IDENTITY CASCADE")
+            logger.info(f"Cleared tables {tables}")
         except Exception as e:
-            logger.warning(f"Could not clear table {table_name}: {str(e)}")
+            logger.warning(f"Could not clear tables {tables}: {str(e)}")
     
     @log_function_call
     def validate_data_warehouse(self) -> Dict[str, int]:
@@ -300,6 +594,16 @@ def load_data(transformed_data: Dict[str, pd.DataFrame]) -> None:
     loader = DataLoader()
     loader.load_data(transformed_data)
 
+def load_csv_direct(csv_path) -> None:
+    """
+    Main function to load the raw CSV directly through the staging table
+    
+    Args:
+        csv_path: Path to raw CSV file
+    """
+    loader = DataLoader()
+    loader.load_csv_direct(csv_path)
+
 if __name__ == "__main__":
     # Test loading
     from .extract import extract_data
@@ -12,6 +12,7 @@ import re
 from pathlib import Path
 
 from ..utils.logging import get_logger, log_function_call
+from ..utils.files import FILE_BUFFER_SIZE
 
 logger = get_logger(__name__)
 
@@ -23,12 +24,13 @@ class DataTransformer:
         self.fact_data = None
     
     @log_function_call
-    def transform_data(self, df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    def transform_data(self, df: pd.DataFrame, cleaned: bool = False) -> Dict[str, pd.DataFrame]:
         """
         Transform raw data into dimensional model
         
         Args:
             df: Raw DataFrame
+            cleaned: True if df already went through clean_data (e.g. per chunk)
             
         Returns:
             Dictionary with dimension tables and fact table
@@ -37,7 +39,7 @@ class DataTransformer:
             logger.info("Starting data transformation")
             
             # Clean and prepare data
-            cleaned_df = self._clean_data(df)
+            cleaned_df = df if cleaned else self._clean_data(df)
             
             # Create dimension tables
             self._create_dimensions(cleaned_df)
@@ -45,6 +47,13 @@ class DataTransformer:
             # Create fact table
             self._create_fact_table(cleaned_df)
             
+            # Keys were resolved on the parsed Timestamps; the warehouse stores time of day
+            time_df = self.dimension_tables['time']
+            self.dimension_tables['time'] = time_df.assign(time=time_df['time'].dt.time)
+            
+            # Save processed data to files
+            self._save_processed_data()
+            
             logger.info("Data transformation completed successfully")
             
             return {
@@ -72,29 +81,43 @@ class DataTransformer:
         """
         logger.info("Cleaning data")
         
-        # Create a copy to avoid modifying original
-        cleaned_df = df.copy()
-        
-        # Convert date column
-        cleaned_df['Date'] = pd.to_datetime(cleaned_df['Date'])
+        # Build the converted columns, then assemble the result from them and
+        # the caller's untouched columns with copy=False, so the other columns
+        # are not deep-copied on any pandas version
+        updates = {
+            # Convert date column; an explicit format skips per-value inference
+            'Date': pd.to_datetime(df['Date'], format='%m/%d/%Y', cache=True),
+            # Convert time column; kept as Timestamp (on 1900-01-01) so grouping
+            # and key lookups stay vectorized, dim_time converts it to time of day
+            'Time': pd.to_datetime(df['Time'], format='%I:%M:%S %p', cache=True),
+        }
         
-        # Convert time column
-        cleaned_df['Time'] = pd.to_datetime(cleaned_df['Time'], format='%I:%M:%S %p').dt.time
-        
-        # Clean string columns
+        # Clean string columns; they have a handful of distinct values, so
+        # strip the categories once instead of every row
         string_columns = ['Branch', 'City', 'Customer type', 'Gender', 'Product line', 'Payment']
         for col in string_columns:
-            if col in cleaned_df.columns:
-                cleaned_df[col] = cleaned_df[col].str.strip()
+            if col in df.columns:
+                updates[col] = _strip_categorical(df[col])
         
         # Ensure numeric columns are numeric
-        numeric_columns = ['Unit price', 'Quantity', 'Tax 5%', 'Sales', 'cogs', 'gross income', 'Rating']
-        for col in numeric_columns:
-            if col in cleaned_df.columns:
-                cleaned_df[col] = pd.to_numeric(cleaned_df[col], errors='coerce')
+        numeric_columns = [col for col in ['Unit price', 'Quantity', 'Tax 5%', 'Sales', 'cogs', 'gross income', 'Rating']
+                           if col in df.columns]
+        updates.update(df[numeric_columns].apply(pd.to_numeric, errors='coerce').items())
+        
+        # Downcast columns whose values survive it exactly: Quantity is a small
+        # count and Rating has one decimal. Money columns stay float64 so their
+        # DECIMAL rounding is unchanged
+        if 'Quantity' in updates:
+            updates['Quantity'] = pd.to_numeric(updates['Quantity'], downcast='integer')
+        if 'Rating' in updates:
+            updates['Rating'] = pd.to_numeric(updates['Rating'], downcast='float')
         
-        # Handle missing values
-        cleaned_df = cleaned_df.dropna()
+        cleaned_df = pd.DataFrame({col: updates.get(col, df[col]) for col in df.columns}, copy=False)
+        
+        # Handle missing values; rows are only filtered (and copied) when some are incomplete
+        complete = cleaned_df.notna().all(axis=1).to_numpy()
+        if not complete.all():
+            cleaned_df = cleaned_df[complete]
         
         logger.info(f"Data cleaning completed. {len(cleaned_df)} records remaining")
         return cleaned_df
@@ -121,23 +144,17 @@ class DataTransformer:
         self.dimension_tables['product'] = product_df
         
         # Time dimension
-        time_data = []
-        for _, row in df[['Date', 'Time']].drop_duplicates().iterrows():
-            date = row['Date']
-            time = row['Time']
-            time_data.append({
-                'date': date,
-                'time': time,
-                'year': date.year,
-                'month': date.month,
-                'day': date.day,
-                'quarter': (date.month - 1) // 3 + 1,
-                'weekday': date.weekday(),
-                'is_weekend': date.weekday() >= 5
-            })
-        
-        self.dimension_tables['time'] = pd.DataFrame(time_data)
-        self.dimension_tables['time'].insert(0, 'time_id', range(1, len(self.dimension_tables['time']) + 1))
+        time_df = df[['Date', 'Time']].drop_duplicates().reset_index(drop=True)
+        time_df.columns = ['date', 'time']
+        dates = time_df['date'].dt
+        time_df['year'] = dates.year
+        time_df['month'] = dates.month
+        time_df['day'] = dates.day
+        time_df['quarter'] = dates.quarter
+        time_df['weekday'] = dates.weekday
+        time_df['is_weekend'] = time_df['weekday'] >= 5
+        time_df.insert(0, 'time_id', range(1, len(time_df) + 1))
+        self.dimension_tables['time'] = time_df
         
         # Branch dimension
         branch_df = df[['Branch', 'City']].drop_duplicates().reset_index(drop=True)
@@ -162,60 +179,46 @@ class DataTransformer:
         """
         logger.info("Creating fact table")
         
-        # Create lookup dictionaries for foreign keys
-        customer_lookup = dict(zip(
-            zip(self.dimension_tables['customer']['customer_type'], 
-                self.dimension_tables['customer']['gender']),
-            self.dimension_tables['customer']['customer_id']
-        ))
-        
-        product_lookup = dict(zip(
-            zip(self.dimension_tables['product']['product_line'], 
-                self.dimension_tables['product']['unit_price']),
-            self.dimension_tables['product']['product_id']
-        ))
-        
-        time_lookup = dict(zip(
-            zip(self.dimension_tables['time']['date'], 
-                self.dimension_tables['time']['time']),
-            self.dimension_tables['time']['time_id']
-        ))
-        
-        branch_lookup = dict(zip(
-            zip(self.dimension_tables['branch']['branch'], 
-                self.dimension_tables['branch']['city']),
-            self.dimension_tables['branch']['branch_id']
-        ))
+        # Resolve foreign keys by looking up each row's natural key in the
+        # dimension's key index, without building merged intermediate frames
+        dimension_keys = [
+            ('customer', {'customer_type': 'Customer type', 'gender': 'Gender'}),
+            ('product', {'product_line': 'Product line', 'unit_price': 'Unit price'}),
+            ('time', {'date': 'Date', 'time': 'Time'}),
+            ('branch', {'branch': 'Branch', 'city': 'City'}),
+            ('payment', {'payment_method': 'Payment'}),
+        ]
         
-        payment_lookup = dict(zip(
-            self.dimension_tables['payment']['payment_method'],
-            self.dimension_tables['payment']['payment_id']
-        ))
+        foreign_keys = {}
+        for dim_name, key_columns in dimension_keys:
+            dim = self.dimension_tables[dim_name]
+            id_column = dim.columns[0]
+            dim_keys = pd.MultiIndex.from_frame(dim[list(key_columns)])
+            row_keys = pd.MultiIndex.from_frame(df[list(key_columns.values())])
+            positions = dim_keys.get_indexer(row_keys)
+            if (positions < 0).any():
+                raise ValueError(f"Rows with no matching {dim_name} dimension key")
+            foreign_keys[id_column] = dim[id_column].to_numpy()[positions]
         
         # Create fact table
-        fact_data = []
-        for _, row in df.iterrows():
-            fact_data.append({
-                'invoice_id': row['Invoice ID'],
-                'customer_id': customer_lookup.get((row['Customer type'], row['Gender'])),
-                'product_id': product_lookup.get((row['Product line'], row['Unit price'])),
-                'time_id': time_lookup.get((row['Date'], row['Time'])),
-                'branch_id': branch_lookup.get((row['Branch'], row['City'])),
-                'payment_id': payment_lookup.get(row['Payment']),
-                'quantity': row['Quantity'],
-                'tax_5_percent': row['Tax 5%'],
-                'sales': row['Sales'],
-                'cogs': row['cogs'],
-                'gross_margin_percentage': row['gross margin percentage'],
-                'gross_income': row['gross income'],
-                'rating': row['Rating']
-            })
+        measures = df[[
+            'Quantity', 'Tax 5%', 'Sales', 'cogs', 'gross margin percentage', 'gross income', 'Rating'
+        ]].rename(columns={
+            'Quantity': 'quantity',
+            'Tax 5%': 'tax_5_percent',
+            'Sales': 'sales',
+            'gross margin percentage': 'gross_margin_percentage',
+            'gross income': 'gross_income',
+            'Rating': 'rating'
+        })
+        fact_data = pd.concat([
+            df[['Invoice ID']].rename(columns={'Invoice ID': 'invoice_id'}),
+            pd.DataFrame(foreign_keys, index=df.index),
+            measures
+        ], axis=1)
         
-        self.fact_data = pd.DataFrame(fact_data)
+        self.fact_data = fact_data.reset_index(drop=True)
         logger.info(f"Fact table created with {len(self.fact_data)} records")
-        
-        # Save processed data to files
-        self._save_processed_data()
     
     def _save_processed_data(self):
         """Save processed data to processed directory"""
@@ -224,32 +227,112 @@ class DataTransformer:
             processed_dir = Path(__file__).parent.parent.parent / "data" / "processed"
             processed_dir.mkdir(parents=True, exist_ok=True)
             
-            # Save dimension tables
+            # Save dimension tables (mixed types, dates and categories stay on to_csv)
             for table_name, table_data in self.dimension_tables.items():
                 file_path = processed_dir / f"{table_name}.csv"
-                table_data.to_csv(file_path, index=False)
+                with open(file_path, 'w', buffering=FILE_BUFFER_SIZE, newline='', encoding='utf-8') as file:
+                    table_data.to_csv(file, index=False, lineterminator='\n', chunksize=100_000)
                 logger.info(f"Saved {table_name} to {file_path}")
             
-            # Save fact table
+            # Save fact table; it is numeric apart from invoice_id, so it
+            # takes the %-formatting fast path when possible
             fact_file_path = processed_dir / "fact_sales.csv"
-            self.fact_data.to_csv(fact_file_path, index=False)
+            if not _write_plain_csv(self.fact_data, fact_file_path):
+                with open(fact_file_path, 'w', buffering=FILE_BUFFER_SIZE, newline='', encoding='utf-8') as file:
+                    self.fact_data.to_csv(file, index=False, lineterminator='\n', chunksize=100_000)
             logger.info(f"Saved fact_sales to {fact_file_path}")
             
         except Exception as e:
             logger.error(f"Failed to save processed data: {str(e)}")
 
-def transform_data(df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+def _strip_categorical(series: pd.Series) -> pd.Series:
+    """
+    Strip surrounding whitespace from a low-cardinality string column
+    
+    Args:
+        series: String or categorical column
+        
+    Returns:
+        Categorical column with stripped values
+    """
+    categorical = series.astype('category')
+    stripped = categorical.cat.categories.str.strip()
+    if stripped.is_unique:
+        return categorical.cat.rename_categories(stripped)
+    # Values differing only by whitespace collapse into one category
+    return categorical.str.strip().astype('category')
+
+# Characters that would need quoting in a CSV field
+_CSV_SPECIAL_CHARS = r'[,"\r\n]'
+
+def _write_plain_csv(df: pd.DataFrame, file_path: Path) -> bool:
+    """
+    Write a DataFrame of numbers and plain strings to CSV without to_csv
+    
+    Each column is turned into Python values whose str() matches pandas'
+    CSV output, and rows are rendered with one %-format string.
+    
+    Args:
+        df: DataFrame to write
+        file_path: Target CSV file
+        
+    Returns:
+        False if the frame has nulls, other dtypes or strings that need
+        quoting, in which case nothing is written
+    """
+    columns = []
+    for name, col in df.items():
+        kind = col.dtype.kind
+        if col.isna().any():
+            return False
+        if kind in 'iu' or col.dtype == np.float64:
+            columns.append(col.tolist())
+        elif kind == 'f':
+            # str() of a widened float32 shows binary noise; numpy's own
+            # shortest repr matches to_csv
+            columns.append(col.to_numpy().astype(str).tolist())
+        elif kind == 'O' or isinstance(col.dtype, pd.StringDtype):
+            if col.astype(str).str.contains(_CSV_SPECIAL_CHARS).any():
+                return False
+            columns.append(col.tolist())
+        else:
+            return False
+    
+    row_format = ','.join(['%s'] * len(columns)) + '\n'
+    with open(file_path, 'w', buffering=FILE_BUFFER_SIZE, newline='', encoding='utf-8') as file:
+        file.write(','.join(df.columns) + '\n')
+        file.writelines(row_format % row for row in zip(*columns))
+    return True
+
+def clean_data(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Clean a raw DataFrame or chunk
+    
+    Cleaning is row-local, so independent chunks can be cleaned in parallel
+    and concatenated before building the dimensional model.
+    
+    Args:
+        df: Raw DataFrame
+        
+    Returns:
+        Cleaned DataFrame
+    """
+    transformer = DataTransformer()
+    return transformer._clean_data(df)
+
+def transform_data(df: pd.DataFrame, cleaned: bool = False) -> Dict[str, pd.DataFrame]:
     """
     Main function to transform data
     
     Args:
         df: Raw DataFrame
+        cleaned: True if df was already cleaned with clean_data
         
     Returns:
         Dictionary with transformed data
     """
     transformer = DataTransformer()
-    return transformer.transform_data(df)
+    return transformer.transform_data(df, cleaned=cleaned)
 
 if __name__ == "__main__":
     # Test transformation
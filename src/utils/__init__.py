@@ -0,0 +1,24 @@
+"""
+Utilities for Supermarket Sales Data Warehouse
+
+Helpers are resolved on first access (PEP 562), so importing the package
+does not import their modules.
+"""
+
+_LAZY_ATTRIBUTES = {
+    'load_config': 'config',
+    'get_database_config': 'config',
+    'get_data_paths': 'config',
+    'get_etl_config': 'config',
+    'get_data_quality_config': 'config',
+    'setup_logging': 'logging',
+    'get_logger': 'logging',
+    'FILE_BUFFER_SIZE': 'files',
+}
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        import importlib
+        module = importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,26 +3,37 @@
 Configuration utilities for Supermarket Sales Data Warehouse
 """
 
-import yaml
 import os
+import functools
 from pathlib import Path
 from typing import Dict, Any
 
 def load_config(config_path: str = None) -> Dict[str, Any]:
     """
-    Load configuration from YAML file
+    Load configuration from YAML file (parsed once per path and cached)
     
     Args:
         config_path: Path to config file. If None, uses default config.yaml
         
     Returns:
-        Dictionary containing configuration
+        Dictionary containing configuration; shared between callers, so
+        treat it as read-only
     """
     if config_path is None:
         config_path = Path(__file__).parent.parent.parent / "config.yaml"
     
+    return _read_config(os.fspath(config_path))
+
+@functools.lru_cache(maxsize=4)
+def _read_config(config_path: str) -> Dict[str, Any]:
+    """Parse a config file; cached by load_config"""
+    # Imported here so importing this module stays cheap
+    import yaml
+    
+    # libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
     with open(config_path, 'r', encoding='utf-8') as file:
-        config = yaml.safe_load(file)
+        config = yaml.load(file, Loader=loader)
     
     return config
 
@@ -42,9 +53,11 @@ def get_database_config() -> Dict[str, str]:
         'port': int(os.getenv('DB_PORT', db_config['port'])),
         'name': os.getenv('DB_NAME', db_config['name']),
         'user': os.getenv('DB_USER', db_config['user']),
-        'password': os.getenv('DB_PASSWORD', db_config['password'])
+        'password': os.getenv('DB_PASSWORD', db_config['password']),
+        'pool': db_config.get('pool', {})
     }
 
+@functools.lru_cache(maxsize=1)
 def get_data_paths() -> Dict[str, Path]:
     """
     Get data paths configuration
@@ -71,6 +84,7 @@ def get_etl_config() -> Dict[str, Any]:
     config = load_config()
     return config['etl']
 
+@functools.lru_cache(maxsize=1)
 def get_data_quality_config() -> Dict[str, Any]:
     """
     Get data quality configuration
@@ -0,0 +1,6 @@
+"""
+File I/O settings for Supermarket Sales Data Warehouse
+"""
+
+# Buffer for processed and warehouse CSV files (Python's default is 8 KiB)
+FILE_BUFFER_SIZE = 1 << 20
@@ -4,11 +4,15 @@ Logging utilities for Supermarket Sales Data Warehouse
 """
 
 import logging
+import logging.handlers
 import os
 import sys
 from pathlib import Path
 from typing import Optional
 
+# Records buffered in memory before they are written to the log file
+FILE_LOG_BUFFER_RECORDS = 1000
+
 def setup_logging(
     log_level: str = "INFO",
     log_file: Optional[str] = None,
@@ -24,7 +28,13 @@ def setup_logging(
         
     Returns:
         Configured logger instance
+    
+    Handlers are attached to the "supermarket_sales" logger once; later
+    calls return it unchanged instead of stacking more handlers.
     """
+    logger = logging.getLogger("supermarket_sales")
+    if getattr(logger, '_configured', False):
+        return logger
     
     # Default format
     if log_format is None:
@@ -60,15 +70,21 @@ def setup_logging(
     file_handler.setLevel(getattr(logging, log_level.upper()))
     file_handler.setFormatter(logging.Formatter(log_format))
     
-    # Configure logging
-    logging.basicConfig(
-        level=getattr(logging, log_level.upper()),
-        format=log_format,
-        handlers=[console_handler, file_handler]
+    # Buffer file records and write them in batches; errors flush immediately
+    # and anything left is flushed when logging shuts down at exit
+    buffered_file_handler = logging.handlers.MemoryHandler(
+        capacity=FILE_LOG_BUFFER_RECORDS,
+        flushLevel=logging.ERROR,
+        target=file_handler
     )
+    buffered_file_handler.setLevel(getattr(logging, log_level.upper()))
     
-    # Create logger
-    logger = logging.getLogger("supermarket_sales")
+    # Configure the package logger; module loggers from get_logger propagate to it
+    logger.setLevel(getattr(logging, log_level.upper()))
+    logger.handlers.clear()
+    logger.addHandler(console_handler)
+    logger.addHandler(buffered_file_handler)
+    logger._configured = True
     
     return logger
 
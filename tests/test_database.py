@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Tests for the COPY payload helpers in src.database.connection
+
+These encode DataFrames in memory and need no database.
+"""
+
+import struct
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.database.connection import (
+    DatabaseConnection,
+    _DataFrameCSVStream,
+    PGCOPY_HEADER,
+    PGCOPY_TRAILER,
+)
+
+encode = DatabaseConnection._encode_binary_copy
+
+def _rows(payload, row_format):
+    """Strip header and trailer and unpack the fixed-width rows"""
+    assert payload.startswith(PGCOPY_HEADER)
+    assert payload.endswith(PGCOPY_TRAILER)
+    body = payload[len(PGCOPY_HEADER):-len(PGCOPY_TRAILER)]
+    return list(struct.iter_unpack(row_format, body))
+
+def test_binary_copy_header_and_integers():
+    df = pd.DataFrame({'a': [1, -2], 'b': [3, 4]}, dtype='int64')
+    payload = encode(df, {'a': 'integer', 'b': 'bigint'})
+    assert _rows(payload, '>hiiiq') == [(2, 4, 1, 8, 3), (2, 4, -2, 8, 4)]
+
+def test_binary_copy_dates_count_from_2000():
+    df = pd.DataFrame({'d': pd.to_datetime(['2000-01-01', '2000-01-02', '1999-12-31'])})
+    payload = encode(df, {'d': 'date'})
+    assert [row[2] for row in _rows(payload, '>hii')] == [0, 1, -1]
+
+def test_binary_copy_times_in_microseconds():
+    expected = [0, ((1 * 60 + 2) * 60 + 3) * 1_000_000 + 4]
+    parsed = pd.DataFrame({'t': pd.to_datetime(['1900-01-01 00:00:00', '1900-01-01 01:02:03.000004'], format='ISO8601')})
+    times = pd.DataFrame({'t': [datetime.time(0, 0), datetime.time(1, 2, 3, 4)]})
+    for df in (parsed, times):
+        payload = encode(df, {'t': 'time without time zone'})
+        assert [row[2] for row in _rows(payload, '>hiq')] == expected
+
+def test_binary_copy_floats_and_booleans():
+    df = pd.DataFrame({'x': [1.5, 2.0], 'n': [1, 2], 'flag': [True, False]})
+    payload = encode(df, {'x': 'double precision', 'n': 'real', 'flag': 'boolean'})
+    assert _rows(payload, '>hidifi?') == [(3, 8, 1.5, 4, 1.0, 1, True), (3, 8, 2.0, 4, 2.0, 1, False)]
+
+@pytest.mark.parametrize("pg_type, value", [
+    ('smallint', np.iinfo('int16').max + 1),
+    ('integer', np.iinfo('int32').min - 1),
+])
+def test_binary_copy_rejects_out_of_range_integers(pg_type, value):
+    df = pd.DataFrame({'a': [0, value]}, dtype='int64')
+    assert encode(df, {'a': pg_type}) is None
+
+@pytest.mark.parametrize("data, pg_type", [
+    ({'a': ['1.5x']}, 'real'),
+    ({'a': ['1']}, 'double precision'),
+    ({'a': [1.5]}, 'integer'),
+    ({'a': ['t']}, 'boolean'),
+    ({'a': [1.0, None]}, 'double precision'),
+    ({'a': ['x']}, 'text'),
+])
+def test_binary_copy_falls_back_to_csv(data, pg_type):
+    assert encode(pd.DataFrame(data), {'a': pg_type}) is None
+
+@pytest.mark.parametrize("size", [1, 7, 64, -1])
+def test_csv_stream_matches_to_csv(size):
+    df = pd.DataFrame({'a': range(10), 'b': ['x', 'y,z', None, 'w', 'v'] * 2})
+    expected = df.to_csv(index=False, header=False, na_rep='\\N')
+
+    stream = _DataFrameCSVStream(df, chunk_rows=3)
+    parts = []
+    while True:
+        data = stream.read(size)
+        if not data:
+            break
+        assert size < 0 or len(data) <= size
+        parts.append(data)
+    assert ''.join(parts) == expected
+
+def test_csv_stream_empty_frame():
+    assert _DataFrameCSVStream(pd.DataFrame({'a': []})).read(16) == ''